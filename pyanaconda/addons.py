@@ -20,7 +20,6 @@
 __all__ = ["AddonSection", "AddonRegistry", "AddonData", "collect_addon_paths"]
 
 import os
-import functools
 from pykickstart.sections import Section
 
 from pyanaconda.progress import progress_message
@@ -49,23 +48,33 @@ def collect_addon_paths(toplevel_addon_paths, ui_subdir="gui"):
 
     for path in toplevel_addon_paths:
         try:
-            directories = os.listdir(path)
+            with os.scandir(path) as entries:
+                directories = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
         except OSError:
             directories = []
 
-        for addon_id in directories:
-            addon_ks_path = os.path.join(path, addon_id, "ks")
-            if os.path.isdir(addon_ks_path):
+        for addon_id, addon_path in directories:
+            # read the addon directory only once
+            try:
+                with os.scandir(addon_path) as entries:
+                    subdirectories = {entry.name: entry.path for entry in entries if entry.is_dir()}
+            except OSError:
+                continue
+
+            addon_ks_path = subdirectories.get("ks")
+            if addon_ks_path:
                 module_paths["ks"].append(("%s.ks.%%s" % addon_id, addon_ks_path))
                 log.debug('Loading ks section into module path for addon %s', addon_id)
 
-            addon_spoke_path = os.path.join(path, addon_id, ui_subdir, "spokes")
-            if os.path.isdir(addon_spoke_path):
-                module_paths["spokes"].append(("%s.%s.spokes.%%s" % (addon_id, ui_subdir), addon_spoke_path))
-                log.debug('Loading spokes into module path for addon %s', addon_id)
+            addon_ui_path = subdirectories.get(ui_subdir)
+            if addon_ui_path:
+                addon_spoke_path = os.path.join(addon_ui_path, "spokes")
+                if os.path.isdir(addon_spoke_path):
+                    module_paths["spokes"].append(("%s.%s.spokes.%%s" % (addon_id, ui_subdir), addon_spoke_path))
+                    log.debug('Loading spokes into module path for addon %s', addon_id)
 
-            addon_category_path = os.path.join(path, addon_id, "categories")
-            if os.path.isdir(addon_category_path):
+            addon_category_path = subdirectories.get("categories")
+            if addon_category_path:
                 module_paths["categories"].append(("%s.categories.%%s" % addon_id, addon_category_path))
                 log.debug('Loading categories into module path for addon %s', addon_id)
 
@@ -83,31 +92,25 @@ class AddonRegistry(object):
         self.__dict__ = dictionary
 
     def __str__(self):
-        return functools.reduce(lambda acc, id_addon: acc + str(id_addon[1]),
-                                self.__dict__.items(), "")
+        return "".join(str(addon) for addon in self.__dict__.values())
 
     def execute(self, storage, ksdata, users, payload):
         """This method calls execute on all the registered addons."""
         for v in self.__dict__.values():
-            if hasattr(v, "execute"):
-                progress_message(N_("Executing %s addon") % v.name)
-                v.execute(storage, ksdata, users, payload)
+            progress_message(N_("Executing %s addon") % v.name)
+            v.execute(storage, ksdata, users, payload)
 
     def setup(self, storage, ksdata, payload):
         """This method calls setup on all the registered addons."""
         # filter out placeholders (should be imported now)
-        d = {}
-        for k, v in self.__dict__.items():
-            if not v.name == PLACEHOLDER_NAME:
-                d[k] = v
-            else:
-                log.warning("Removing placeholder for addon %s. Addon wasn't imported!", k)
-
-        self.__dict__ = d
+        placeholders = [k for k, v in self.__dict__.items() if v.name == PLACEHOLDER_NAME]
+        for k in placeholders:
+            log.warning("Removing placeholder for addon %s. Addon wasn't imported!", k)
+            del self.__dict__[k]
+
         for v in self.__dict__.values():
-            if hasattr(v, "setup"):
-                progress_message(N_("Setting up %s addon") % v.name)
-                v.setup(storage, ksdata, payload)
+            progress_message(N_("Setting up %s addon") % v.name)
+            v.setup(storage, ksdata, payload)
 
 
 class AddonData(object):
@@ -128,12 +131,21 @@ class AddonData(object):
 
     def __init__(self, name):
         self.name = name
-        self.content = ""
+        self._content_lines = []
         self.header_args = ""
 
     def __str__(self):
         return "%%addon %s %s\n%s%%end\n" % (self.name, self.header_args, self.content)
 
+    @property
+    def content(self):
+        """The content of the addon section."""
+        return "".join(self._content_lines)
+
+    @content.setter
+    def content(self, value):
+        self._content_lines = [value]
+
     def setup(self, storage, ksdata, payload):
         """Make the changes to the install system.
 
@@ -170,7 +182,7 @@ class AddonData(object):
 
     def handle_line(self, line):
         """Process one kickstart line."""
-        self.content += line
+        self._content_lines.append(line)
 
     def finalize(self):
         """No additional data will come.
@@ -62,7 +62,7 @@ class DBusContainer(object):
         self._basename = basename
 
         self._container = {}
-        self._published = set()
+        self._object_paths = {}
         self._counter = 0
 
     def set_namespace(self, namespace):
@@ -127,7 +127,7 @@ class DBusContainer(object):
         :param obj: an object
         :return: True if the object is published, otherwise False
         """
-        return id(obj) in self._published
+        return id(obj) in self._object_paths
 
     def _publish_object(self, obj: Publishable):
         """Publish the given object.
@@ -143,7 +143,7 @@ class DBusContainer(object):
         )
 
         self._container[object_path] = obj
-        self._published.add(id(obj))
+        self._object_paths[id(obj)] = object_path
         return object_path
 
     def _find_object_path(self, obj):
@@ -153,9 +153,10 @@ class DBusContainer(object):
         :return: a DBus path
         :raise: DBusContainerError if no object path is found
         """
-        for object_path, found_obj in self._container.items():
-            if found_obj is obj:
-                return object_path
+        object_path = self._object_paths.get(id(obj))
+
+        if object_path is not None:
+            return object_path
 
         raise DBusContainerError("Unknown object: {}".format(obj))
 
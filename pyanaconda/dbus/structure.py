@@ -45,6 +45,7 @@ class DBusField(object):
         :param description: a description
         """
         self._name = name
+        self._data_name = name.replace('-', '_')
         self._type_hint = type_hint
         self._description = description
 
@@ -78,7 +79,7 @@ class DBusField(object):
 
         :return: a data attribute name
         """
-        return self.name.replace('-', '_')
+        return self._data_name
 
     def set_data(self, obj, value):
         """Set the data attribute.
@@ -86,7 +87,7 @@ class DBusField(object):
         :param obj: a data object
         :param value: a value
         """
-        setattr(obj, self.data_name, value)
+        setattr(obj, self._data_name, value)
 
     def get_data(self, obj):
         """Get the data attribute.
@@ -94,7 +95,7 @@ class DBusField(object):
         :param obj: a data object
         :return: a value
         """
-        return getattr(obj, self.data_name)
+        return getattr(obj, self._data_name)
 
     def get_data_variant(self, obj):
         """Get a variant of the data attribute.
@@ -102,7 +103,7 @@ class DBusField(object):
         :param obj: a data object
         :return: a variant
         """
-        return get_variant(self.type_hint, self.get_data(obj))
+        return get_variant(self._type_hint, getattr(obj, self._data_name))
 
 
 class DBusData(ABC):
@@ -111,8 +112,12 @@ class DBusData(ABC):
     Classes derived from this class should represent specific types
     of DBus structures. They will support a conversion from a DBus
     structure of this type to a Python object and back.
+
+    Data classes can define __slots__ for their attributes.
     """
 
+    __slots__ = ()
+
     def __init_subclass__(cls, *args, **kwargs):
         """Create a new data class."""
         super().__init_subclass__(*args, **kwargs)
@@ -152,13 +157,12 @@ class DBusData(ABC):
         if not isinstance(data, cls):
             raise TypeError("Invalid type '{}'.".format(type(data).__name__))
 
-        structure = {}
         fields = get_fields(cls)
 
-        for name, field in fields.items():
-            structure[name] = field.get_data_variant(data)
-
-        return structure
+        return {
+            name: field.get_data_variant(data)
+            for name, field in fields.items()
+        }
 
     @classmethod
     def from_structure_list(cls, structures: List[Dict]):
@@ -30,6 +30,8 @@ class NetworkDeviceConfiguration(DBusData):
     Device type is additional information useful for clients.
     """
 
+    __slots__ = ("_device_name", "_connection_uuid", "_device_type")
+
     DEVICE_TYPE_UNKNOWN = 0
 
     def __init__(self):
@@ -71,6 +73,8 @@ class NetworkDeviceConfiguration(DBusData):
 class NetworkDeviceInfo(DBusData):
     """Holds information about network device."""
 
+    __slots__ = ("_device_name", "_hw_address", "_device_type")
+
     DEVICE_TYPE_UNKNOWN = 0
 
     def __init__(self):
@@ -251,6 +251,15 @@ class PartitioningRequest(DBusData):
 class MountPointRequest(DBusData):
     """Mount point request data."""
 
+    __slots__ = (
+        "_device_spec",
+        "_mount_point",
+        "_mount_options",
+        "_reformat",
+        "_format_type",
+        "_format_options",
+    )
+
     def __init__(self):
         self._device_spec = ""
         self._mount_point = ""
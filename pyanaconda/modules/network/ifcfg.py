@@ -462,6 +462,42 @@ def update_onboot_value(connection_uuid, onboot, root_path=""):
     return True
 
 
+def update_onboot_values(onboot_values, root_path=""):
+    """Update onboot values of multiple connections in ifcfg files.
+
+    Each of the ifcfg files is read and written at most once.
+
+    :param onboot_values: values of ONBOOT setting indexed by uuid of the connection
+    :type onboot_values: dict(str, bool)
+    :param root_path: optional root path for ifcfg files to be updated
+    :type root_path: str
+    :returns: uuids of the connections for which the value was updated
+    :rtype: set(str)
+    """
+    pending_values = dict(onboot_values)
+    updated_uuids = set()
+
+    for file_path in get_ifcfg_files_paths(os.path.normpath(root_path + IFCFG_DIR)):
+        if not pending_values:
+            break
+        ifcfg = IfcfgFile(file_path)
+        ifcfg.read()
+        connection_uuid = ifcfg.get('UUID')
+        if connection_uuid not in pending_values:
+            continue
+        old_value = ifcfg.get('ONBOOT')
+        new_value = "yes" if pending_values.pop(connection_uuid) else "no"
+        log.debug("updating ONBOOT value of %s from %s to %s", connection_uuid, old_value, new_value)
+        ifcfg.set(('ONBOOT', new_value))
+        ifcfg.write()
+        updated_uuids.add(connection_uuid)
+
+    for connection_uuid in pending_values:
+        log.debug("can't find ifcfg file of %s", connection_uuid)
+
+    return updated_uuids
+
+
 def update_slaves_onboot_value(nm_client, master_devname, onboot, root_path="", uuid=None):
     """Update onboot value in slave ifcfg files of given master.
 
@@ -21,9 +21,9 @@ from pyanaconda.anaconda_loggers import get_module_logger
 from pyanaconda.modules.network.network_interface import NetworkInitializationTaskInterface
 from pyanaconda.modules.network.nm_client import get_device_name_from_network_data, \
     ensure_active_connection_for_device, update_connection_from_ksdata, add_connection_from_ksdata, \
-    update_iface_setting_values, bound_hwaddr_of_device
+    update_iface_setting_values, bound_hwaddr_of_device, get_ifaces_by_hwaddr
 from pyanaconda.modules.network.ifcfg import get_ifcfg_file_of_device, find_ifcfg_uuid_of_device, \
-    update_onboot_value, update_slaves_onboot_value
+    update_onboot_values, update_slaves_onboot_value
 from pyanaconda.modules.network.device_configuration import supported_wired_device_types
 from pyanaconda.core.configuration.anaconda import conf
 from functools import wraps
@@ -35,6 +35,45 @@ gi.require_version("NM", "1.0")
 from gi.repository import NM
 
 
+def _check_available_connections(iface, cons):
+    """Check the available connections of a device in one pass.
+
+    :param iface: name of the device
+    :type iface: str
+    :param cons: available connections of the device
+    :type cons: list(NM.RemoteConnection)
+    :returns: whether the device is a slave and the first connection
+              bound to the interface name of the device (or None)
+    :rtype: tuple(bool, NM.RemoteConnection)
+    """
+    device_is_slave = False
+    con_for_iface = None
+    for con in cons:
+        if con.get_setting_connection().get_master():
+            device_is_slave = True
+        if con_for_iface is None and con.get_interface_name() == iface:
+            con_for_iface = con
+    return device_is_slave, con_for_iface
+
+
+def _get_ifaces_by_hwaddr_if_needed(nm_client, network_data):
+    """Index the devices by mac address if any of the devices is specified by it.
+
+    :param nm_client: instance of NetworkManager client
+    :type nm_client: NM.Client
+    :param network_data: kickstart network data
+    :type network_data: list(NetworkData)
+    :returns: names of devices indexed by upper case mac addresses or None
+              if no device is specified by mac address or BOOTIF
+    :rtype: dict(str, str)
+    """
+    for data in network_data:
+        spec = data.device or ""
+        if ':' in spec or spec == 'bootif':
+            return get_ifaces_by_hwaddr(nm_client)
+    return None
+
+
 def guard_by_system_configuration(return_value):
     def wrap(function):
         @wraps(function)
@@ -67,11 +106,18 @@ class ApplyKickstartTask(Task):
         """
         super().__init__()
         self._nm_client = nm_client
-        self._network_data = network_data
-        self._supported_devices = supported_devices
+        self._network_data = []
+        self._supported_devices = frozenset(supported_devices)
         self._bootif = bootif
         self._ifname_option_values = ifname_option_values
 
+        for data in network_data:
+            # Wireless is not supported
+            if data.essid:
+                log.info("%s: Wireless devices configuration is not supported.", self.name)
+                continue
+            self._network_data.append(data)
+
     @property
     def name(self):
         return "Apply kickstart"
@@ -97,21 +143,24 @@ class ApplyKickstartTask(Task):
             log.debug("%s: No NetworkManager available.", self.name)
             return applied_devices
 
-        for network_data in self._network_data:
-            # Wireless is not supported
-            if network_data.essid:
-                log.info("%s: Wireless devices configuration is not supported.", self.name)
-                continue
+        # Looking up the ifcfg file reads all the ifcfg files so cache the
+        # results for devices referred to by multiple kickstart commands.
+        ifcfg_files = {}
+        ifaces_by_hwaddr = _get_ifaces_by_hwaddr_if_needed(self._nm_client, self._network_data)
 
+        for network_data in self._network_data:
             device_name = get_device_name_from_network_data(self._nm_client,
                                                             network_data,
                                                             self._supported_devices,
-                                                            self._bootif)
+                                                            self._bootif,
+                                                            ifaces_by_hwaddr=ifaces_by_hwaddr)
             if not device_name:
                 log.warning("%s: --device %s not found", self.name, network_data.device)
                 continue
 
-            ifcfg_file = get_ifcfg_file_of_device(self._nm_client, device_name)
+            if device_name not in ifcfg_files:
+                ifcfg_files[device_name] = get_ifcfg_file_of_device(self._nm_client, device_name)
+            ifcfg_file = ifcfg_files[device_name]
             if ifcfg_file and ifcfg_file.is_from_kickstart:
                 if network_data.activate:
                     if ensure_active_connection_for_device(self._nm_client, ifcfg_file.uuid,
@@ -140,6 +189,8 @@ class ApplyKickstartTask(Task):
                 add_connection_from_ksdata(self._nm_client, network_data, device_name,
                                            activate=network_data.activate,
                                            ifname_option_values=self._ifname_option_values)
+                # The added connection has a new ifcfg file
+                del ifcfg_files[device_name]
 
         return applied_devices
 
@@ -185,8 +236,10 @@ class ConsolidateInitramfsConnectionsTask(Task):
             if number_of_connections < 2:
                 continue
 
+            device_is_slave, con_for_iface = _check_available_connections(iface, cons)
+
             # Ignore devices which are slaves
-            if any(con.get_setting_connection().get_master() for con in cons):
+            if device_is_slave:
                 log.debug("%s: %d for %s - it is OK, device is a slave",
                           self.name, number_of_connections, iface)
                 continue
@@ -195,7 +248,6 @@ class ConsolidateInitramfsConnectionsTask(Task):
             if not ifcfg_file:
                 log.debug("%s: %d for %s - no ifcfg file found",
                           self.name, number_of_connections, iface)
-                con_for_iface = self._select_persistent_connection_for_iface(iface, cons)
                 if not con_for_iface:
                     log.debug("%s: %d for %s - no suitable connection for the interface found",
                               self.name, number_of_connections, iface)
@@ -221,13 +273,6 @@ class ConsolidateInitramfsConnectionsTask(Task):
 
         return consolidated_devices
 
-    def _select_persistent_connection_for_iface(self, iface, cons):
-        """Select the connection suitable to store configuration for the interface."""
-        for con in cons:
-            if con.get_interface_name() == iface:
-                return con
-        return None
-
 
 class SetRealOnbootValuesFromKickstartTask(Task):
     """Task for setting of real ONBOOT values from kickstart."""
@@ -249,7 +294,7 @@ class SetRealOnbootValuesFromKickstartTask(Task):
         super().__init__()
         self._nm_client = nm_client
         self._network_data = network_data
-        self._supported_devices = supported_devices
+        self._supported_devices = frozenset(supported_devices)
         self._bootif = bootif
         self._ifname_option_values = ifname_option_values
 
@@ -278,11 +323,22 @@ class SetRealOnbootValuesFromKickstartTask(Task):
             log.debug("%s: No kickstart data.", self.name)
             return updated_devices
 
+        # Only ONBOOT values are updated so the ifcfg uuids can be cached
+        ifcfg_uuids = {}
+        ifaces_by_hwaddr = _get_ifaces_by_hwaddr_if_needed(self._nm_client, self._network_data)
+        # ONBOOT values to be written to ifcfg files indexed by connection uuid
+        # and the devices which are updated by writing them. They are written
+        # before any other update of ONBOOT values so the kickstart commands
+        # are still applied in their order.
+        onboot_values = {}
+        ifcfg_updated_devices = []
+
         for network_data in self._network_data:
             device_name = get_device_name_from_network_data(self._nm_client,
                                                             network_data,
                                                             self._supported_devices,
-                                                            self._bootif)
+                                                            self._bootif,
+                                                            ifaces_by_hwaddr=ifaces_by_hwaddr)
             if not device_name:
                 log.warning("%s: --device %s does not exist.", self.name, network_data.device)
 
@@ -301,19 +357,23 @@ class SetRealOnbootValuesFromKickstartTask(Task):
                 if network_data.onboot:
                     # We need to handle "no" -> "yes" change by changing ifcfg file instead of the NM connection
                     # so the device does not get autoactivated (BZ #1261864)
-                    uuid = find_ifcfg_uuid_of_device(self._nm_client, devname) or ""
-                    if not update_onboot_value(uuid, network_data.onboot, root_path=""):
-                        continue
+                    uuid = self._find_ifcfg_uuid_of_device(devname, ifcfg_uuids)
+                    onboot_values[uuid] = network_data.onboot
+                    ifcfg_updated_devices.append((devname, uuid))
+                    continue
                 else:
+                    self._write_onboot_values(onboot_values, ifcfg_updated_devices,
+                                              updated_devices)
                     n_cons = update_iface_setting_values(self._nm_client, devname,
                         [("connection", NM.SETTING_CONNECTION_AUTOCONNECT, network_data.onboot)])
                     if n_cons != 1:
                         log.debug("%s: %d connections found for %s", self.name, n_cons, devname)
                         if n_cons > 1:
                             # In case of multiple connections for a device, update ifcfg directly
-                            uuid = find_ifcfg_uuid_of_device(self._nm_client, devname) or ""
-                            if not update_onboot_value(uuid, network_data.onboot, root_path=""):
-                                continue
+                            uuid = self._find_ifcfg_uuid_of_device(devname, ifcfg_uuids)
+                            onboot_values[uuid] = network_data.onboot
+                            ifcfg_updated_devices.append((devname, uuid))
+                            continue
 
                 updated_devices.append(devname)
 
@@ -329,11 +389,43 @@ class SetRealOnbootValuesFromKickstartTask(Task):
                         uuid = cons[0].get_uuid()
                     else:
                         log.debug("%s: %d connections found for %s", self.name, n_cons, master)
+                self._write_onboot_values(onboot_values, ifcfg_updated_devices,
+                                          updated_devices)
                 updated_slaves = update_slaves_onboot_value(self._nm_client, master, network_data.onboot, uuid=uuid)
                 updated_devices.extend(updated_slaves)
 
+        self._write_onboot_values(onboot_values, ifcfg_updated_devices, updated_devices)
         return updated_devices
 
+    def _write_onboot_values(self, onboot_values, ifcfg_updated_devices, updated_devices):
+        """Write the pending ONBOOT values to ifcfg files.
+
+        Each of the ifcfg files is written at most once. The pending values
+        and devices are cleared.
+
+        :param onboot_values: ONBOOT values indexed by connection uuid
+        :type onboot_values: dict(str, bool)
+        :param ifcfg_updated_devices: device names and uuids of their connections
+        :type ifcfg_updated_devices: list(tuple(str, str))
+        :param updated_devices: names of updated devices to be extended
+        :type updated_devices: list(str)
+        """
+        if not onboot_values:
+            return
+
+        updated_uuids = update_onboot_values(onboot_values, root_path="")
+        updated_devices.extend(devname for devname, uuid in ifcfg_updated_devices
+                               if uuid in updated_uuids)
+        onboot_values.clear()
+        ifcfg_updated_devices.clear()
+
+    def _find_ifcfg_uuid_of_device(self, device_name, ifcfg_uuids):
+        """Find uuid of the ifcfg file of the device using the cache of found uuids."""
+        if device_name not in ifcfg_uuids:
+            ifcfg_uuids[device_name] = find_ifcfg_uuid_of_device(self._nm_client,
+                                                                 device_name) or ""
+        return ifcfg_uuids[device_name]
+
 
 class DumpMissingIfcfgFilesTask(Task):
     """Task for dumping of missing ifcfg files."""
@@ -361,9 +453,12 @@ class DumpMissingIfcfgFilesTask(Task):
         """Return a DBus representation."""
         return NetworkInitializationTaskInterface(self)
 
-    def _select_persistent_connection_for_device(self, device, cons):
-        """Select the connection suitable to store configuration for the device."""
-        iface = device.get_iface()
+    def _select_persistent_connection_for_device(self, device, iface, cons, con_for_iface):
+        """Select the connection suitable to store configuration for the device.
+
+        The active connection is preferred over the given connection bound to the
+        interface name of the device.
+        """
         ac = device.get_active_connection()
         if ac:
             con = ac.get_connection()
@@ -372,10 +467,7 @@ class DumpMissingIfcfgFilesTask(Task):
             else:
                 log.debug("%s: active connection for %s can't be used as persistent",
                           self.name, iface)
-        for con in cons:
-            if con.get_interface_name() == iface:
-                return con
-        return None
+        return con_for_iface
 
     def _update_connection(self, con, iface):
         log.debug("%s: updating id and binding (interface-name) of connection %s for %s",
@@ -415,7 +507,7 @@ class DumpMissingIfcfgFilesTask(Task):
 
             cons = device.get_available_connections()
             n_cons = len(cons)
-            device_is_slave = any(con.get_setting_connection().get_master() for con in cons)
+            device_is_slave, con_for_iface = _check_available_connections(iface, cons)
 
             if n_cons == 0:
                 log.debug("%s: creating default connection for %s", self.name, iface)
@@ -435,7 +527,8 @@ class DumpMissingIfcfgFilesTask(Task):
                 if not device_is_slave:
                     log.debug("%s: %d non-slave connections found for device %s",
                               self.name, n_cons, iface)
-                    con = self._select_persistent_connection_for_device(device, cons)
+                    con = self._select_persistent_connection_for_device(device, iface, cons,
+                                                                        con_for_iface)
                     if not con:
                         log.warning("%s: none of the connections %s can be dumped as persistent",
                                     self.name, [con.get_uuid() for con in cons])
@@ -382,8 +382,9 @@ class NetworkModule(KickstartModule):
     def _update_network_data_with_onboot(self, network_data, ifaces):
         if not ifaces:
             return
+        supported_devices = frozenset(dev_info.device_name
+                                      for dev_info in self.get_supported_devices())
         for nd in network_data:
-            supported_devices = [dev_info.device_name for dev_info in self.get_supported_devices()]
             device_name = get_device_name_from_network_data(self.nm_client,
                                                             nd, supported_devices, self.bootif)
             if device_name in ifaces:
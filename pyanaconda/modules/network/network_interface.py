@@ -18,6 +18,9 @@
 # Red Hat, Inc.
 #
 
+import operator
+
+from pyanaconda.core.timer import Timer
 from pyanaconda.modules.common.constants.services import NETWORK
 from pyanaconda.dbus.property import emits_properties_changed
 from pyanaconda.dbus.typing import *  # pylint: disable=wildcard-import
@@ -47,6 +50,10 @@ class NetworkInterface(KickstartModuleInterface):
 
     def connect_signals(self):
         super().connect_signals()
+        # The device configurations and their DBus structures.
+        self._device_configurations_cache = None
+        # The changes of device configurations waiting to be emitted.
+        self._device_configurations_changes = []
         self.watch_property("Hostname", self.implementation.hostname_changed)
         self.implementation.current_hostname_changed.connect(self.CurrentHostnameChanged)
         self.watch_property("Connected", self.implementation.connected_changed)
@@ -164,10 +171,28 @@ class NetworkInterface(KickstartModuleInterface):
         their uuid.
         """
         dev_cfgs = self.implementation.get_device_configurations()
-        return NetworkDeviceConfiguration.to_structure_list(dev_cfgs)
+
+        # Reuse the structures if the configurations haven't changed.
+        if self._device_configurations_cache:
+            cached_cfgs, structures = self._device_configurations_cache
+
+            if len(cached_cfgs) == len(dev_cfgs) \
+                    and all(map(operator.is_, cached_cfgs, dev_cfgs)):
+                return structures
+
+        structures = NetworkDeviceConfiguration.to_structure_list(dev_cfgs)
+        self._device_configurations_cache = (dev_cfgs, structures)
+        return structures
 
     def _device_configurations_changed(self, changes):
-        self.DeviceConfigurationChanged([
+        # The configurations can be changed in place.
+        self._device_configurations_cache = None
+
+        # Emit changes that come in a row in a single signal.
+        if not self._device_configurations_changes:
+            Timer().timeout_now(self._emit_device_configurations_changes)
+
+        self._device_configurations_changes.extend([
             (
                 NetworkDeviceConfiguration.to_structure(old),
                 NetworkDeviceConfiguration.to_structure(new)
@@ -175,6 +200,12 @@ class NetworkInterface(KickstartModuleInterface):
             for old, new in changes
         ])
 
+    def _emit_device_configurations_changes(self):
+        changes = self._device_configurations_changes
+        self._device_configurations_changes = []
+        self.DeviceConfigurationChanged(changes)
+        return False
+
     @dbus_signal
     def DeviceConfigurationChanged(self, changes: List[Tuple[Structure, Structure]]):
         """Signal change of network devices configurations."""
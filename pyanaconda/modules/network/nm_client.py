@@ -51,20 +51,26 @@ def get_iface_from_connection(nm_client, uuid):
     return iface
 
 
+def _get_hwaddr_of_device(device):
+    """Get the mac address identifying the device."""
+    if device.get_device_type() in (NM.DeviceType.ETHERNET,
+                                    NM.DeviceType.WIFI):
+        try:
+            address = device.get_permanent_hw_address()
+            if not address:
+                address = device.get_hw_address()
+        except AttributeError as e:
+            log.warning("Device %s: %s", device.get_iface(), e)
+            address = device.get_hw_address()
+    else:
+        address = device.get_hw_address()
+    return address
+
+
 def get_iface_from_hwaddr(nm_client, hwaddr):
     """Find the name of device specified by mac address."""
     for device in nm_client.get_devices():
-        if device.get_device_type() in (NM.DeviceType.ETHERNET,
-                                        NM.DeviceType.WIFI):
-            try:
-                address = device.get_permanent_hw_address()
-                if not address:
-                    address = device.get_hw_address()
-            except AttributeError as e:
-                log.warning("Device %s: %s", device.get_iface(), e)
-                address = device.get_hw_address()
-        else:
-            address = device.get_hw_address()
+        address = _get_hwaddr_of_device(device)
         # per #1703152, at least in *some* case, we wind up with
         # address as None here, so we need to guard against that
         if address and address.upper() == hwaddr.upper():
@@ -72,6 +78,24 @@ def get_iface_from_hwaddr(nm_client, hwaddr):
     return None
 
 
+def get_ifaces_by_hwaddr(nm_client):
+    """Get names of devices indexed by their mac addresses.
+
+    Useful for repeated lookups of devices specified by mac address.
+
+    :param nm_client: instance of NetworkManager client
+    :type nm_client: NM.Client
+    :returns: names of devices indexed by upper case mac addresses
+    :rtype: dict(str, str)
+    """
+    ifaces = {}
+    for device in nm_client.get_devices():
+        address = _get_hwaddr_of_device(device)
+        if address:
+            ifaces.setdefault(address.upper(), device.get_iface())
+    return ifaces
+
+
 def get_team_port_config_from_connection(nm_client, uuid):
     connection = nm_client.get_connection_by_uuid(uuid)
     if not connection:
@@ -94,7 +118,8 @@ def get_team_config_from_connection(nm_client, uuid):
     return config
 
 
-def get_device_name_from_network_data(nm_client, network_data, supported_devices, bootif):
+def get_device_name_from_network_data(nm_client, network_data, supported_devices, bootif,
+                                      ifaces_by_hwaddr=None):
     """Get the device name from kickstart device specification.
 
     Generally given by --device option. For vlans also --interfacename
@@ -104,13 +129,22 @@ def get_device_name_from_network_data(nm_client, network_data, supported_devices
 
     :param network_data: a kickstart device configuartion
     :type network_data: kickstart NetworkData object
-    :param supported_devices: list of names of supported devices
-    :type supported_devices: list(str)
+    :param supported_devices: names of supported devices
+    :type supported_devices: set(str) or list(str)
     :param bootif: MAC addres of device to be used for --device=bootif specification
     :type bootif: str
+    :param ifaces_by_hwaddr: names of devices indexed by upper case mac addresses
+                             as returned by get_ifaces_by_hwaddr; if not given,
+                             the devices are looked up in NetworkManager
+    :type ifaces_by_hwaddr: dict(str, str)
     :returns: device name the configuration should be used for
     :rtype: str
     """
+    def _get_iface_from_hwaddr(hwaddr):
+        if ifaces_by_hwaddr is None:
+            return get_iface_from_hwaddr(nm_client, hwaddr)
+        return ifaces_by_hwaddr.get(hwaddr.upper())
+
     spec = network_data.device
     device_name = ""
     msg = ""
@@ -124,12 +158,12 @@ def get_device_name_from_network_data(nm_client, network_data, supported_devices
         msg = "existing device found"
     # Specification by mac address
     elif ':' in spec:
-        device_name = get_iface_from_hwaddr(nm_client, spec) or ""
+        device_name = _get_iface_from_hwaddr(spec) or ""
         msg = "existing device found"
     # Specification by BOOTIF boot option
     elif spec == 'bootif':
         if bootif:
-            device_name = get_iface_from_hwaddr(nm_client, bootif) or ""
+            device_name = _get_iface_from_hwaddr(bootif) or ""
             msg = "existing device for {} found".format(bootif)
         else:
             msg = "BOOTIF value is not specified in boot options"
@@ -32,9 +32,16 @@ class AutoPartitioningInterface(PartitioningInterface):
     def connect_signals(self):
         """Connect the signals."""
         super().connect_signals()
+        # The DBus structure of the current request.
+        self._request_structure = None
+        self.implementation.request_changed.connect(self._request_changed)
         self.watch_property("Enabled", self.implementation.enabled_changed)
         self.watch_property("Request", self.implementation.request_changed)
 
+    def _request_changed(self):
+        """Drop the DBus structure of the previous request."""
+        self._request_structure = None
+
     @property
     def Enabled(self) -> Bool:
         """Is the auto partitioning enabled?"""
@@ -51,7 +58,12 @@ class AutoPartitioningInterface(PartitioningInterface):
     @property
     def Request(self) -> Structure:
         """The partitioning request."""
-        return PartitioningRequest.to_structure(self.implementation.request)
+        if self._request_structure is None:
+            self._request_structure = PartitioningRequest.to_structure(
+                self.implementation.request
+            )
+
+        return self._request_structure
 
     @emits_properties_changed
     def SetRequest(self, request: Structure):
@@ -32,6 +32,8 @@ from pyanaconda.modules.storage.partitioning.validate import StorageValidateTask
 
 log = get_module_logger(__name__)
 
+ZERO_SIZE = Size(0)
+
 
 class ManualPartitioningModule(PartitioningModule):
     """The manual partitioning module."""
@@ -137,16 +139,16 @@ class ManualPartitioningModule(PartitioningModule):
 
         :return: a list of instances of MountPointRequest
         """
-        available_requests = set(self.requests)
+        devicetree = self.storage.devicetree
+        available_requests = self._get_requests_by_device(devicetree)
         requests = []
 
-        for device in self._iterate_usable_devices():
-            # Find an existing request.
-            request = self._find_request_for_device(device, available_requests)
+        for device in self._iterate_usable_devices(devicetree):
+            # Find an existing request and use it only once.
+            device_requests = available_requests.get(device)
 
-            # And use it only once.
-            if request:
-                available_requests.remove(request)
+            if device_requests:
+                request = device_requests.pop(0)
             # Otherwise, create a new request.
             else:
                 request = self._create_request_for_device(device)
@@ -156,36 +158,42 @@ class ManualPartitioningModule(PartitioningModule):
 
         return requests
 
-    def _iterate_usable_devices(self):
+    def _iterate_usable_devices(self, devicetree):
         """Iterate over all usable devices.
 
+        :param devicetree: a Blivet's device tree
         :return: an iterator over Blivet's devices
         """
-        selected_disks = set(self._selected_disks)
+        selected_disks = frozenset(self._selected_disks)
 
-        for device in self.storage.devicetree.leaves:
+        for device in devicetree.leaves:
             # Is the device usable?
-            if device.protected or device.size == Size(0):
+            if device.protected or device.size == ZERO_SIZE:
                 continue
 
             # All device's disks have to be in selected disks.
-            if selected_disks and not selected_disks.issuperset({d.name for d in device.disks}):
+            if selected_disks and not all(d.name in selected_disks for d in device.disks):
                 continue
 
             yield device
 
-    def _find_request_for_device(self, device, requests):
-        """Find a mount point request for the given device.
+    def _get_requests_by_device(self, devicetree):
+        """Get the mount point requests indexed by their devices.
 
-        :param device: a Blivet's device object
-        :param requests: a list of requests to search
-        :return: an instance of MountPointRequest or None
+        Requests for devices that don't exist are skipped.
+
+        :param devicetree: a Blivet's device tree
+        :return: a dictionary of Blivet's devices and lists of requests
         """
-        for request in requests:
-            if device is self.storage.devicetree.resolve_device(request.device_spec):
-                return request
+        requests = {}
 
-        return None
+        for request in self.requests:
+            device = devicetree.resolve_device(request.device_spec)
+
+            if device is not None:
+                requests.setdefault(device, []).append(request)
+
+        return requests
 
     def _create_request_for_device(self, device):
         """Create a mount point request for the given device.
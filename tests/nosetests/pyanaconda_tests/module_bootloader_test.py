@@ -19,7 +19,7 @@
 #
 import tempfile
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, create_autospec
 
 from tests.nosetests.pyanaconda_tests import patch_dbus_publish_object, check_dbus_property, \
     check_task_creation
@@ -43,6 +43,20 @@ from pyanaconda.modules.storage.bootloader.bootloader_interface import Bootloade
 from pyanaconda.modules.storage.bootloader.installation import ConfigureBootloaderTask, \
     InstallBootloaderTask
 
+BOOTLOADER_BY_PLATFORM = (
+    (platform.X86, GRUB2),
+    (platform.EFI, EFIGRUB),
+    (platform.MacEFI, MacEFIGRUB),
+    (platform.PPC, GRUB2),
+    (platform.IPSeriesPPC, IPSeriesGRUB2),
+    (platform.PowerNV, PowerNVGRUB2),
+    (platform.S390, ZIPL),
+    (platform.Aarch64EFI, Aarch64EFIGRUB),
+    (platform.ARM, EXTLINUX),
+    (platform.ArmEFI, ArmEFIGRUB),
+    (Mock(), BootLoader)
+)
+
 
 class BootloaderInterfaceTestCase(unittest.TestCase):
     """Test DBus interface of the bootloader module."""
@@ -168,6 +182,7 @@ class BootloaderInterfaceTestCase(unittest.TestCase):
 
         storage = Mock()
         storage.devices = [device]
+        storage.bootloader = create_autospec(BootLoader, instance=True)
 
         self.bootloader_module.on_storage_reset(storage)
 
@@ -188,7 +203,7 @@ class BootloaderInterfaceTestCase(unittest.TestCase):
 
         obj = check_task_creation(self, task_path, publisher, ConfigureBootloaderTask)
 
-        self.assertEqual(obj.implementation._storage, storage)
+        self.assertIs(obj.implementation._storage, storage)
         self.assertEqual(obj.implementation._versions, [version])
 
     @patch_dbus_publish_object
@@ -201,7 +216,7 @@ class BootloaderInterfaceTestCase(unittest.TestCase):
 
         obj = check_task_creation(self, task_path, publisher, InstallBootloaderTask)
 
-        self.assertEqual(obj.implementation._storage, storage)
+        self.assertIs(obj.implementation._storage, storage)
 
 
 class BootloaderTasksTestCase(unittest.TestCase):
@@ -209,32 +224,31 @@ class BootloaderTasksTestCase(unittest.TestCase):
 
     def configure_test(self):
         """Test the final configuration of the boot loader."""
-        bootloader = Mock()
+        bootloader = create_autospec(BootLoader, instance=True)
         storage = Mock(bootloader=bootloader)
 
         version = "4.17.7-200.fc28.x86_64"
 
         with tempfile.TemporaryDirectory() as root:
             ConfigureBootloaderTask(storage, BootloaderMode.DISABLED, [version], root).run()
+            bootloader.add_image.assert_not_called()
 
-        bootloader.add_image.assert_not_called()
-
-        with tempfile.TemporaryDirectory() as root:
             ConfigureBootloaderTask(storage, BootloaderMode.ENABLED, [version], root).run()
+            bootloader.add_image.assert_called_once()
 
-        bootloader.add_image.assert_called_once()
         image = bootloader.add_image.call_args[0][0]
 
         self.assertIsInstance(image, LinuxBootLoaderImage)
-        self.assertEqual(image, bootloader.default)
+        self.assertIs(image, bootloader.default)
         self.assertEqual(image.version, version)
         self.assertEqual(image.label, "anaconda")
         self.assertEqual(image.short_label, "linux")
-        self.assertEqual(image.device, storage.root_device)
+        self.assertIs(image.device, storage.root_device)
 
     def install_test(self):
         """Test the installation task for the boot loader."""
-        bootloader = Mock()
+        bootloader = create_autospec(BootLoader, instance=True)
+        bootloader.stage1_device = Mock()
         storage = Mock(bootloader=bootloader)
 
         InstallBootloaderTask(storage, BootloaderMode.DISABLED).run()
@@ -253,25 +267,10 @@ class BootloaderClassTestCase(unittest.TestCase):
 
     def get_bootloader_class_test(self):
         """Test get_bootloader_class."""
-
-        bootloader_by_platform = {
-            platform.X86: GRUB2,
-            platform.EFI: EFIGRUB,
-            platform.MacEFI: MacEFIGRUB,
-            platform.PPC: GRUB2,
-            platform.IPSeriesPPC: IPSeriesGRUB2,
-            platform.PowerNV: PowerNVGRUB2,
-            platform.S390: ZIPL,
-            platform.Aarch64EFI: Aarch64EFIGRUB,
-            platform.ARM: EXTLINUX,
-            platform.ArmEFI: ArmEFIGRUB,
-            Mock(): BootLoader
-        }
-
-        for platform_type, bootloader_type in bootloader_by_platform.items():
+        for platform_type, bootloader_type in BOOTLOADER_BY_PLATFORM:
             # Get the bootloader class.
             cls = get_bootloader_class(platform_type)
-            self.assertEqual(cls, bootloader_type)
+            self.assertIs(cls, bootloader_type)
 
             # Get the bootloader instance.
             obj = cls()
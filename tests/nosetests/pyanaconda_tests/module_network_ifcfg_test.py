@@ -28,7 +28,7 @@ from pyanaconda.core.kickstart.commands import NetworkData
 from pyanaconda.modules.network.ifcfg import get_dracut_arguments_from_ifcfg, IFCFG_DIR, \
     IfcfgFile, get_ifcfg_files_paths, get_ifcfg_file, get_ifcfg_file_of_device, \
     get_slaves_from_ifcfgs, get_kickstart_network_data, update_onboot_value, \
-    update_slaves_onboot_value
+    update_onboot_values, update_slaves_onboot_value
 
 HWADDR_TO_IFACE = {
     "52:54:00:0c:77:e3": "ens6",
@@ -1820,6 +1820,63 @@ class IfcfgFileTestCase(unittest.TestCase):
         self.assertFalse(update_onboot_value(not_found_uuid, False, root_path=self._root_dir))
         self._check_ifcfg_files(ifcfg_files_set_to_no)
 
+    def update_onboot_values_test(self):
+        """Test update_onboot_values."""
+        onboot_yes_uuid = "c9e36ab2-de90-4321-98fb-63fba02dec87"
+        onboot_no_uuid = "9ca1144d-ceba-4454-b800-b58e39ebeab8"
+        onboot_missing_uuid = "7eb32ca0-dbc3-4ea9-89ca-0185b017f3d6"
+        not_found_uuid = "7201c278-c3ed-4d6b-8f3e-7c290cfb23cc"
+        initial_ifcfg_files = [
+            ("ifcfg-ens3",
+             """
+             ONBOOT=yes
+             UUID={}
+             """.format(onboot_yes_uuid),
+             None),
+            ("ifcfg-ens5",
+             """
+             ONBOOT=no
+             UUID={}
+             """.format(onboot_no_uuid),
+             None),
+            ("ifcfg-ens6",
+             """
+             UUID={}
+             """.format(onboot_missing_uuid),
+             None),
+        ]
+        updated_ifcfg_files = [
+            ("ifcfg-ens3",
+             """
+             ONBOOT="no"
+             UUID="{}"
+             """.format(onboot_yes_uuid),
+             None),
+            ("ifcfg-ens5",
+             """
+             ONBOOT="yes"
+             UUID="{}"
+             """.format(onboot_no_uuid),
+             None),
+            # NOTE: nothing is written as the file is not updated,
+            # therefore no quotes.
+            ("ifcfg-ens6",
+             """
+             UUID={}
+             """.format(onboot_missing_uuid),
+             None),
+        ]
+        self._dump_ifcfg_files(initial_ifcfg_files)
+        onboot_values = {
+            onboot_yes_uuid: False,
+            onboot_no_uuid: True,
+            not_found_uuid: True,
+        }
+        self.assertEqual(update_onboot_values(onboot_values, root_path=self._root_dir),
+                         {onboot_yes_uuid, onboot_no_uuid})
+        self._check_ifcfg_files(updated_ifcfg_files)
+        self.assertEqual(update_onboot_values({}, root_path=self._root_dir), set())
+
     @patch("pyanaconda.modules.network.ifcfg.find_ifcfg_uuid_of_device",
            lambda client, device_name, root_path: DEVNAME_TO_UUID[device_name])
     def _update_slaves_onboot_value_of_a_device_type(self, device_type_master_key):
@@ -38,10 +38,13 @@ from pyanaconda.modules.network.firewall.firewall import FirewallModule
 from pyanaconda.modules.network.firewall.firewall_interface import FirewallInterface
 from pyanaconda.modules.network.firewall.installation import ConfigureFirewallTask
 from pyanaconda.modules.network.kickstart import DEFAULT_DEVICE_SPECIFICATION
+from pyanaconda.modules.common.structures.network import NetworkDeviceConfiguration
 from pyanaconda.dbus.typing import *  # pylint: disable=wildcard-import
 from pyanaconda.modules.network.initialization import ApplyKickstartTask, \
     SetRealOnbootValuesFromKickstartTask, DumpMissingIfcfgFilesTask, \
     ConsolidateInitramfsConnectionsTask
+from pyanaconda.modules.network.nm_client import get_ifaces_by_hwaddr, \
+    get_device_name_from_network_data
 
 import gi
 gi.require_version("NM", "1.0")
@@ -177,6 +180,65 @@ class NetworkInterfaceTestCase(unittest.TestCase):
         """Test GetDeviceConfigurations."""
         self.assertListEqual(self.network_interface.GetDeviceConfigurations(), [])
 
+    def get_changed_device_configurations_test(self):
+        """Test GetDeviceConfigurations with changed configurations."""
+        dev_cfg = NetworkDeviceConfiguration()
+        dev_cfg.device_name = "ens3"
+        self.network_module.get_device_configurations = Mock(return_value=[dev_cfg])
+
+        structures = self.network_interface.GetDeviceConfigurations()
+        self.assertEqual(get_native(structures)[0]["device-name"], "ens3")
+        self.assertEqual(get_native(structures)[0]["connection-uuid"], "")
+        self.assertIs(self.network_interface.GetDeviceConfigurations(), structures)
+
+        old_dev_cfg = NetworkDeviceConfiguration()
+        old_dev_cfg.device_name = "ens3"
+        dev_cfg.connection_uuid = "mocked_uuid"
+        self.network_module.configurations_changed.emit([(old_dev_cfg, dev_cfg)])
+
+        structures = self.network_interface.GetDeviceConfigurations()
+        self.assertEqual(get_native(structures)[0]["device-name"], "ens3")
+        self.assertEqual(get_native(structures)[0]["connection-uuid"], "mocked_uuid")
+
+        self.network_module.get_device_configurations = Mock(return_value=[])
+        self.assertListEqual(self.network_interface.GetDeviceConfigurations(), [])
+
+    @patch('pyanaconda.modules.network.network_interface.Timer')
+    def device_configuration_changed_test(self, timer_cls):
+        """Test DeviceConfigurationChanged."""
+        callback = Mock()
+        self.network_interface.DeviceConfigurationChanged.connect(callback)
+
+        empty_cfg = NetworkDeviceConfiguration()
+        ens3_cfg = NetworkDeviceConfiguration()
+        ens3_cfg.device_name = "ens3"
+        ens4_cfg = NetworkDeviceConfiguration()
+        ens4_cfg.device_name = "ens4"
+        ens4_new_cfg = NetworkDeviceConfiguration()
+        ens4_new_cfg.device_name = "ens4"
+        ens4_new_cfg.connection_uuid = "mocked_uuid"
+
+        # The changes in a row are scheduled for a single emission.
+        self.network_module.configurations_changed.emit([(empty_cfg, ens3_cfg)])
+        self.network_module.configurations_changed.emit([(ens4_cfg, ens4_new_cfg)])
+        timer_cls.return_value.timeout_now.assert_called_once()
+        callback.assert_not_called()
+
+        # Run the scheduled callback.
+        emit_changes = timer_cls.return_value.timeout_now.call_args[0][0]
+        self.assertFalse(emit_changes())
+
+        callback.assert_called_once()
+        changes = get_native(callback.call_args[0][0])
+        self.assertEqual([
+            (old["device-name"], new["device-name"], new["connection-uuid"])
+            for old, new in changes
+        ], [
+            ("", "ens3", ""),
+            ("ens4", "ens4", "mocked_uuid"),
+        ])
+        self.assertEqual(self.network_interface._device_configurations_changes, [])
+
     def network_device_configuration_changed_test(self):
         """Test NetworkDeviceConfigurationChanged."""
         self.network_interface.NetworkDeviceConfigurationChanged()
@@ -1144,3 +1206,170 @@ class NetworkModuleTestCase(unittest.TestCase):
                 "ens11",
             ]
         )
+
+
+class SetRealOnbootValuesFromKickstartTaskTestCase(unittest.TestCase):
+    """Test the task setting real ONBOOT values from kickstart."""
+
+    def setUp(self):
+        """Set up the mocked updates of ONBOOT values."""
+        self.nm_client = Mock()
+        self.nm_client.get_device_by_iface.return_value = None
+
+        for p in [
+            patch("pyanaconda.modules.network.initialization.conf"),
+            patch("pyanaconda.modules.network.initialization.find_ifcfg_uuid_of_device",
+                  side_effect=lambda nm_client, device_name: "uuid-" + device_name),
+        ]:
+            p.start()
+            self.addCleanup(p.stop)
+
+        # Keep the order of all the updates.
+        self.updates = Mock()
+        self.written_onboot_values = []
+
+        patches = [
+            patch("pyanaconda.modules.network.initialization.update_onboot_values",
+                  side_effect=self._write_onboot_values),
+            patch("pyanaconda.modules.network.initialization.update_iface_setting_values",
+                  return_value=1),
+            patch("pyanaconda.modules.network.initialization.update_slaves_onboot_value",
+                  side_effect=lambda nm_client, master, onboot, uuid=None: ["ens3"]),
+        ]
+
+        for p in patches:
+            mocked = p.start()
+            self.addCleanup(p.stop)
+            self.updates.attach_mock(mocked, p.attribute)
+
+    def _write_onboot_values(self, onboot_values, root_path=""):
+        """Record the written ONBOOT values."""
+        self.written_onboot_values.append(dict(onboot_values))
+        return set(onboot_values)
+
+    def _get_network_data(self, device, onboot, bondslaves=""):
+        """Get kickstart network data of a device."""
+        return Mock(
+            device=device,
+            onboot=onboot,
+            bondslaves=bondslaves,
+            vlanid=None,
+            teamslaves=[],
+            bridgeslaves="",
+            interfacename=""
+        )
+
+    def _run_task(self, network_data):
+        """Run the task and return the updated devices and updates."""
+        task = SetRealOnbootValuesFromKickstartTask(
+            self.nm_client,
+            network_data,
+            ["ens3", "ens4"],
+            None,
+            []
+        )
+        updated_devices = task.run()
+        updates = [name for name, _args, _kwargs in self.updates.mock_calls]
+        return updated_devices, updates
+
+    def write_onboot_values_once_test(self):
+        """Test that ONBOOT values of devices are written at once."""
+        updated_devices, updates = self._run_task([
+            self._get_network_data("ens3", True),
+            self._get_network_data("ens4", True),
+        ])
+
+        self.assertEqual(updated_devices, ["ens3", "ens4"])
+        self.assertEqual(updates, ["update_onboot_values"])
+        self.assertEqual(self.written_onboot_values, [{"uuid-ens3": True, "uuid-ens4": True}])
+
+        # No device is specified by mac address.
+        self.nm_client.get_devices.assert_not_called()
+
+    def update_onboot_values_in_order_test(self):
+        """Test that commands updating the same device are applied in order."""
+        # The value of the bond command has to win for the ens3 slave.
+        updated_devices, updates = self._run_task([
+            self._get_network_data("ens3", True),
+            self._get_network_data("bond0", False, bondslaves="ens3"),
+        ])
+
+        self.assertEqual(updated_devices, ["ens3", "bond0", "ens3"])
+        self.assertEqual(updates, [
+            "update_onboot_values",
+            "update_iface_setting_values",
+            "update_slaves_onboot_value",
+        ])
+        self.assertEqual(self.written_onboot_values, [{"uuid-ens3": True}])
+
+
+class NMClientTestCase(unittest.TestCase):
+    """Test the NetworkManager client functions."""
+
+    def _get_device(self, iface, hwaddr):
+        """Get a mocked ethernet device."""
+        device = Mock()
+        device.get_iface.return_value = iface
+        device.get_device_type.return_value = NM.DeviceType.ETHERNET
+        device.get_permanent_hw_address.return_value = hwaddr
+        device.get_hw_address.return_value = hwaddr
+        return device
+
+    def _get_network_data(self, device):
+        """Get kickstart network data of a device."""
+        return Mock(
+            device=device,
+            vlanid=None,
+            bondslaves="",
+            teamslaves=[],
+            bridgeslaves="",
+            interfacename=""
+        )
+
+    def get_ifaces_by_hwaddr_test(self):
+        """Test get_ifaces_by_hwaddr."""
+        nm_client = Mock()
+        nm_client.get_devices.return_value = [
+            self._get_device("ens3", "52:54:00:0c:77:e3"),
+            self._get_device("ens4", "52:54:00:0C:77:E3"),
+            self._get_device("ens5", "52:54:00:0c:77:e4"),
+            self._get_device("ens6", ""),
+        ]
+
+        # The first device with the address wins.
+        self.assertDictEqual(get_ifaces_by_hwaddr(nm_client), {
+            "52:54:00:0C:77:E3": "ens3",
+            "52:54:00:0C:77:E4": "ens5",
+        })
+
+    def get_device_name_from_network_data_by_hwaddr_test(self):
+        """Test get_device_name_from_network_data with indexed devices."""
+        nm_client = Mock()
+        supported_devices = ["ens3", "ens5"]
+        ifaces_by_hwaddr = {
+            "52:54:00:0C:77:E3": "ens3",
+            "52:54:00:0C:77:E4": "ens5",
+            "52:54:00:0C:77:E5": "ens7",
+        }
+
+        def get_device_name(spec, bootif=None):
+            return get_device_name_from_network_data(
+                nm_client,
+                self._get_network_data(spec),
+                supported_devices,
+                bootif,
+                ifaces_by_hwaddr=ifaces_by_hwaddr
+            )
+
+        # The mac address is matched regardless of case.
+        self.assertEqual(get_device_name("52:54:00:0c:77:e4"), "ens5")
+        self.assertEqual(get_device_name("52:54:00:0C:77:E4"), "ens5")
+        self.assertEqual(get_device_name("bootif", bootif="52:54:00:0c:77:e3"), "ens3")
+
+        # Unknown and unsupported devices are not found.
+        self.assertEqual(get_device_name("52:54:00:0c:77:e6"), "")
+        self.assertEqual(get_device_name("52:54:00:0c:77:e5"), "")
+        self.assertEqual(get_device_name("bootif"), "")
+
+        # The devices are not looked up in NetworkManager.
+        nm_client.get_devices.assert_not_called()
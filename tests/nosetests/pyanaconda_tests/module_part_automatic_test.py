@@ -109,6 +109,15 @@ class AutopartitioningInterfaceTestCase(unittest.TestCase):
             out_value
         )
 
+    def request_property_cache_test(self):
+        """Test the cached structure of the property request."""
+        structure = self.interface.Request
+        self.assertIs(self.interface.Request, structure)
+
+        self.interface.SetPassphrase("123456")
+        self.assertIsNot(self.interface.Request, structure)
+        self.assertEqual(self.interface.Request["passphrase"], get_variant(Str, "123456"))
+
     def requires_passphrase_test(self):
         """Test RequiresPassphrase."""
         self.assertEqual(self.interface.RequiresPassphrase(), False)